@@ -11,30 +11,80 @@ import signal
 import secrets
 import fcntl
 import time
-from typing import Dict, List, Optional, Any, Tuple
+import copy
+import hashlib
+import atexit
+import threading
+import queue
+import functools
+import socket
+import socketserver
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Iterable, TextIO, Callable
 import requests
-from lxml import html
+from requests.adapters import HTTPAdapter
+from lxml import html, etree
 import ipaddress
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # --- Configuration ---
 CONFIG = {
     'STATE_DIR': Path(os.path.expanduser("~")) / ".proxy_pilot_state",
     'PROXY_CONFIGS_FILE': "proxy_configs.json",
     'LOG_FILE': "activity.log",
+    'STATUS_CACHE_FILE': "status_cache.json",
+    'STATUS_CACHE_TTL': 2.0,
+    'DEVICE_INFO_CACHE_FILE': "device_info_cache.json",
     'LOG_MAX_ENTRIES': 200,
+    'LOG_ROTATE_BYTES': 128 * 1024,
+    # Entries below this level are dropped before formatting; PROXY_PILOT_LOG_LEVEL=DEBUG turns on per-action tracing.
+    'LOG_LEVEL': os.environ.get('PROXY_PILOT_LOG_LEVEL', 'INFO').upper(),
     'THREPROXY_CONFIG_DIR': Path("/etc/3proxy/conf"),
     'HTTP_PORT_RANGE_START': 7001,
     'HTTP_PORT_RANGE_END': 8000,
     'SOCKS_PORT_RANGE_START': 8001,
     'SOCKS_PORT_RANGE_END': 9000,
     'DEFAULT_TIMEOUT': 15,
+    'DAEMON_SOCKET': "backend.sock",
+    'DAEMON_TIMEOUT': 60,
+    # PROXY_PILOT_PRETTY=1 indents state files and action output for debugging.
+    'PRETTY_JSON': bool(os.environ.get('PROXY_PILOT_PRETTY')),
 }
 
+# Interface-name prefixes HiLink modems show up under.
+_MODEM_IFACE_PREFIXES = ('enx', 'usb', 'wwan', 'ppp')
+_EXCLUDED_IFACE_PREFIXES = ('lo', 'docker', 'veth', 'br-', 'cali', 'vxlan')
+_HILINK_IFACE_PREFIXES = ('enx', 'usb')
+
+# --- JSON Helpers ---
+# orjson is used when installed; the stdlib fallback produces the same compact output.
+def json_loads(data: Any) -> Any:
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(data: Any, pretty: bool = False) -> str:
+    if orjson: return json_dumpb(data, pretty).decode('utf-8')
+    return json.dumps(data, indent=4) if pretty else json.dumps(data, separators=(',', ':'))
+
+def json_dumpb(data: Any, pretty: bool = False) -> bytes:
+    if orjson: return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json_dumps(data, pretty).encode('utf-8')
+
 # --- Initialization ---
 def initialize_environment():
     CONFIG['STATE_DIR'].mkdir(exist_ok=True)
     CONFIG['PROXY_CONFIGS_FILE'] = CONFIG['STATE_DIR'] / CONFIG['PROXY_CONFIGS_FILE']
     CONFIG['LOG_FILE'] = CONFIG['STATE_DIR'] / CONFIG['LOG_FILE']
+    CONFIG['STATUS_CACHE_FILE'] = CONFIG['STATE_DIR'] / CONFIG['STATUS_CACHE_FILE']
+    CONFIG['DEVICE_INFO_CACHE_FILE'] = CONFIG['STATE_DIR'] / CONFIG['DEVICE_INFO_CACHE_FILE']
+    CONFIG['DAEMON_SOCKET'] = CONFIG['STATE_DIR'] / CONFIG['DAEMON_SOCKET']
     try:
         CONFIG['THREPROXY_CONFIG_DIR'].mkdir(parents=True, exist_ok=True)
     except PermissionError:
@@ -42,87 +92,278 @@ def initialize_environment():
         sys.exit(1)
 
 # --- Logging & State Management ---
+# log_message only enqueues; a background thread appends the entries in batches.
+_LOG_QUEUE: "queue.Queue[str]" = queue.Queue()
+_LOG_BATCH_SIZE = 64
+_LOG_FILE_HANDLE: Optional[TextIO] = None
+
+_LOG_LEVEL_ORDER = {"DEBUG": 10, "INFO": 20, "WARN": 30, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+def log_enabled(level: str) -> bool:
+    return _LOG_LEVEL_ORDER.get(level.upper(), 20) >= _LOG_LEVEL_ORDER.get(CONFIG['LOG_LEVEL'], 20)
+
 def log_message(level: str, message: str) -> None:
-    try:
+    if not log_enabled(level): return
+    timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    log_entry = json_dumps({"timestamp": timestamp, "level": level.upper(), "message": str(message)}) + '\n'
+    _LOG_QUEUE.put_nowait(log_entry)
+
+def read_tail_lines(fd: int, count: int, block_size: int = 64 * 1024) -> List[bytes]:
+    """
+    Returns the last `count` lines of the file open on `fd`, reading backwards in blocks.
+    """
+    position = os.fstat(fd).st_size
+    buffer = b''
+    while position > 0 and buffer.count(b'\n') <= count:
+        read_size = min(block_size, position)
+        position -= read_size
+        buffer = os.pread(fd, read_size, position) + buffer
+    return buffer.splitlines(keepends=True)[-count:]
+
+def open_log_file() -> TextIO:
+    global _LOG_FILE_HANDLE
+    if _LOG_FILE_HANDLE is None:
         log_file_path = CONFIG.get('LOG_FILE')
         if not isinstance(log_file_path, Path):
             log_file_path = Path(os.path.expanduser("~")) / ".proxy_pilot_state" / "activity.log"
             log_file_path.parent.mkdir(exist_ok=True)
-        
-        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        log_entry = json.dumps({"timestamp": timestamp, "level": level.upper(), "message": str(message)}) + '\n'
+        _LOG_FILE_HANDLE = open(log_file_path, 'a+', encoding='utf-8')
+    return _LOG_FILE_HANDLE
 
-        with open(log_file_path, 'a+') as f:
-            fcntl.flock(f, fcntl.LOCK_EX)
-            try:
+def write_log_entries(entries: List[str]) -> None:
+    try:
+        f = open_log_file()
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.write(''.join(entries))
+            f.flush()
+            # Trim back to the newest LOG_MAX_ENTRIES once the file outgrows LOG_ROTATE_BYTES.
+            if os.fstat(f.fileno()).st_size > CONFIG['LOG_ROTATE_BYTES']:
+                kept = b''.join(read_tail_lines(f.fileno(), CONFIG['LOG_MAX_ENTRIES']))
                 f.seek(0)
-                lines = f.readlines()
-                if len(lines) >= CONFIG['LOG_MAX_ENTRIES']:
-                    lines_to_keep = lines[-(CONFIG['LOG_MAX_ENTRIES'] - 1):]
-                    f.seek(0)
-                    f.truncate()
-                    f.writelines(lines_to_keep)
-                f.seek(0, os.SEEK_END)
-                f.write(log_entry)
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
+                f.truncate()
+                f.write(kept.decode('utf-8', errors='replace'))
+                f.flush()
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
     except Exception as e:
         sys.stderr.write(f"CRITICAL LOGGING FAILURE: {e}\n")
 
+def _log_drain() -> None:
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        while len(batch) < _LOG_BATCH_SIZE:
+            try: batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty: break
+        try:
+            write_log_entries(batch)
+        finally:
+            for _ in batch: _LOG_QUEUE.task_done()
+
+threading.Thread(target=_log_drain, name="log-drain", daemon=True).start()
+
+def flush_log() -> None:
+    _LOG_QUEUE.join()
+
+def close_log() -> None:
+    global _LOG_FILE_HANDLE
+    flush_log()
+    if _LOG_FILE_HANDLE is not None:
+        _LOG_FILE_HANDLE.close()
+        _LOG_FILE_HANDLE = None
+
+atexit.register(close_log)
+
+# Parsed state files keyed by path, validated against the file's identity so unchanged files are not re-parsed.
+_STATE_CACHE: Dict[Path, Tuple[Tuple[int, int, int], Any]] = {}
+# Serializes writers within this process.
+_STATE_FILE_LOCKS: Dict[Path, threading.Lock] = {}
+# (identity, blake2b digest) of each state file as this process last wrote it.
+_STATE_WRITE_DIGESTS: Dict[Path, Tuple[Tuple[int, int, int], bytes]] = {}
+
+def state_file_identity(st: os.stat_result) -> Tuple[int, int, int]:
+    # mtime can repeat within timestamp granularity; each os.replace brings a new inode.
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
 def read_state_file(file_path: Path, default_value: Any = None) -> Any:
     default_value = default_value if default_value is not None else {}
-    if not file_path.exists(): return default_value
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            fcntl.flock(f, fcntl.LOCK_SH)
-            try: return json.load(f)
-            finally: fcntl.flock(f, fcntl.LOCK_UN)
+        identity = state_file_identity(file_path.stat())
+    except OSError: return default_value
+    cached = _STATE_CACHE.get(file_path)
+    if cached and cached[0] == identity: return copy.deepcopy(cached[1])
+    try:
+        with open(file_path, 'rb') as f:
+            identity = state_file_identity(os.fstat(f.fileno()))
+            data = json_loads(f.read())
     except (json.JSONDecodeError, IOError): return default_value
+    _STATE_CACHE[file_path] = (identity, copy.deepcopy(data))
+    return data
 
-def write_state_file(file_path: Path, data: Any) -> bool:
-    try:
+def write_state_file(file_path: Path, data: Any, durable: bool = True) -> bool:
+    with _STATE_FILE_LOCKS.setdefault(file_path, threading.Lock()):
         temp_file_path = file_path.with_suffix(f'.tmp{os.getpid()}')
-        with open(temp_file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
-        os.replace(temp_file_path, file_path)
-        return True
-    except (IOError, TypeError): return False
+        try:
+            blob = json_dumpb(data, pretty=CONFIG['PRETTY_JSON'])
+            digest = hashlib.blake2b(blob, digest_size=16).digest()
+            try: current_identity = state_file_identity(file_path.stat())
+            except OSError: current_identity = None
+            # Unchanged since our last write.
+            if _STATE_WRITE_DIGESTS.get(file_path) == (current_identity, digest): return True
+            with open(temp_file_path, 'wb') as f:
+                f.write(blob)
+                # Non-durable writes (throwaway caches) skip the sync.
+                f.flush()
+                if durable: os.fdatasync(f.fileno())
+            os.replace(temp_file_path, file_path)
+            identity = state_file_identity(file_path.stat())
+            _STATE_CACHE[file_path] = (identity, copy.deepcopy(data))
+            _STATE_WRITE_DIGESTS[file_path] = (identity, digest)
+            return True
+        except (IOError, TypeError):
+            temp_file_path.unlink(missing_ok=True)
+            return False
+
+def mutate_state_file(file_path: Path, mutator: Callable[[Any], Any], default_value: Any = None) -> Any:
+    """
+    Read-modify-write of a state file under an exclusive lock on a sidecar .lock file.
+    The data file itself is replaced on every write, so it cannot carry the lock. Returns mutator's result,
+    and raises if the new data could not be written, since the caller would otherwise act on state that was not saved.
+    """
+    lock_path = file_path.with_name(file_path.name + '.lock')
+    with open(lock_path, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # This read feeds a write, so bypass the in-process cache.
+        _STATE_CACHE.pop(file_path, None)
+        data = read_state_file(file_path, default_value)
+        result = mutator(data)
+        if not write_state_file(file_path, data):
+            raise Exception(f"Failed to write state file {file_path.name}.")
+        return result
+
+def parse_log_lines(lines: Iterable[Any]) -> Iterator[Dict]:
+    for line in lines:
+        try: yield json_loads(line)
+        except ValueError: continue
+
+def log_cursor_tag(fd: int, offset: int) -> str:
+    """
+    Fingerprints the bytes just before `offset`, so a cursor stops matching once the log is rotated.
+    """
+    start = max(0, offset - 256)
+    return hashlib.blake2b(os.pread(fd, offset - start, start), digest_size=8).hexdigest()
+
+def read_log_tail(count: int, cursor: Optional[str] = None) -> Tuple[List[bytes], str, bool]:
+    """
+    Returns up to the newest `count` log lines, a cursor for the end of the file, and whether the lines are a reset.
+    With a matching cursor only lines appended since are returned; otherwise the plain tail, flagged as a reset.
+    """
+    try: fd = os.open(CONFIG['LOG_FILE'], os.O_RDONLY | os.O_CLOEXEC)
+    except FileNotFoundError: return [], "0:", True
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH)
+        size = os.fstat(fd).st_size
+        offset_text, _, tag = (cursor or '').partition(':')
+        offset = int(offset_text) if offset_text.isdigit() else -1
+        raw_lines = None
+        if 0 <= offset <= size and tag == log_cursor_tag(fd, offset):
+            raw_lines = os.pread(fd, size - offset, offset).splitlines()
+        reset = raw_lines is None or len(raw_lines) > count
+        if reset:
+            raw_lines = read_tail_lines(fd, count)
+        next_cursor = f"{size}:{log_cursor_tag(fd, size)}"
+    finally:
+        os.close(fd)
+    return [line for line in (raw.strip() for raw in raw_lines) if line], next_cursor, reset
+
+def get_logs(cursor: Optional[str] = None) -> Dict:
+    flush_log()
+    lines, next_cursor, reset = read_log_tail(CONFIG['LOG_MAX_ENTRIES'], cursor)
+    try:
+        logs = json_loads(b'[' + b','.join(lines) + b']')
+    except ValueError:
+        # A corrupt line spoils the batch parse; skip bad lines individually.
+        logs = list(parse_log_lines(lines))
+    # reset: data replaces the caller's list instead of extending it.
+    return {"success": True, "data": logs, "next_cursor": next_cursor, "reset": reset}
 
 # --- HiLink Web UI Client ---
+# Status fields on antennapointing.html, keyed by the element id that carries them.
+_ANTENNA_FIELD_IDS = {
+    "network_mode": "network_mode",
+    "operator": "operator",
+    "connection_status": "index_connection_status",
+    "rssi": "rssi",
+    "rsrp": "signal_table_value_1",
+    "sinr": "signal_table_value_2",
+    "rsrq": "signal_table_value_3",
+}
+# Fast path for plain-text fields; nested markup, entities and non-ASCII text fall back to lxml.
+# The lookbehind keeps data-id= and similar attributes from matching.
+_ANTENNA_FIELD_RE = re.compile(rb'(?<![\w-])id=["\'](' + b'|'.join(re.escape(i.encode()) for i in _ANTENNA_FIELD_IDS.values()) + rb')["\'][^>]*>([^<]*)</')
+_ANTENNA_FIELDS_XPATH = etree.XPath('//*[' + ' or '.join(f'@id="{i}"' for i in _ANTENNA_FIELD_IDS.values()) + ']')
+_DEVICE_NAME_XPATH = etree.XPath('//tbody/tr[1]/td[2]')
+_DEVICE_IMEI_XPATH = etree.XPath('//tbody/tr[3]/td[2]')
+
 class HiLinkClient:
     def __init__(self, gateway: str):
         self.base_url = f"http://{gateway}"
         self.session = requests.Session()
+        # One modem per client; no urllib3 retries on top of our own timeouts.
+        self.session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0))
 
-    def get_page(self, path):
+    def fetch_page(self, path) -> bytes:
         try:
             response = self.session.get(f"{self.base_url}/{path}", timeout=5)
             response.raise_for_status()
-            return html.fromstring(response.content)
+            return response.content
         except requests.RequestException as e:
             log_message("ERROR", f"Failed to get HiLink page {path} from {self.base_url}: {e}")
             raise Exception(f"Could not connect to modem at {self.base_url}. Is it connected and on the correct IP?")
 
-    def get_info(self):
-        device_info_tree = self.get_page("html/deviceinformation.html")
-        antennapointing_tree = self.get_page("html/antennapointing.html")
-        
-        def get_text(tree, xpath, index=0):
-            elements = tree.xpath(xpath)
-            return elements[index].text_content().strip() if elements else "N/A"
-
-        info = {
-            "name": get_text(device_info_tree, '//tbody/tr[1]/td[2]'),
-            "imei": get_text(device_info_tree, '//tbody/tr[3]/td[2]'),
-            "network_mode": get_text(antennapointing_tree, '//*[@id="network_mode"]'),
-            "operator": get_text(antennapointing_tree, '//*[@id="operator"]'),
-            "connection_status": get_text(antennapointing_tree, '//*[@id="index_connection_status"]'),
-            "rssi": get_text(antennapointing_tree, '//*[@id="rssi"]'),
-            "rsrp": get_text(antennapointing_tree, '//*[@id="signal_table_value_1"]'),
-            "sinr": get_text(antennapointing_tree, '//*[@id="signal_table_value_2"]'),
-            "rsrq": get_text(antennapointing_tree, '//*[@id="signal_table_value_3"]'),
+    @staticmethod
+    def get_text(tree, xpath: etree.XPath, index=0):
+        elements = xpath(tree)
+        return elements[index].text_content().strip() if elements else "N/A"
+
+    @staticmethod
+    def decode_text(raw: bytes) -> Optional[str]:
+        # Entities and non-ASCII text need the HTML parser; None sends the caller to lxml.
+        if b'&' in raw or not raw.isascii(): return None
+        return raw.decode('ascii').strip()
+
+    def get_device_info(self):
+        device_info_tree = html.fromstring(self.fetch_page("html/deviceinformation.html"))
+        return {
+            "name": self.get_text(device_info_tree, _DEVICE_NAME_XPATH),
+            "imei": self.get_text(device_info_tree, _DEVICE_IMEI_XPATH),
         }
-        return info
+
+    def get_info(self, device_info: Optional[Dict] = None):
+        # Name and IMEI are fixed per device, so callers holding them can skip the device information page.
+        if device_info is None: device_info = self.get_device_info()
+        content = self.fetch_page("html/antennapointing.html")
+
+        found: Dict[str, Optional[str]] = {}
+        for element_id, raw in _ANTENNA_FIELD_RE.findall(content):
+            found.setdefault(element_id.decode('ascii'), self.decode_text(raw))
+
+        if not all(found.get(element_id) for element_id in _ANTENNA_FIELD_IDS.values()):
+            parsed: Dict[str, str] = {}
+            for element in _ANTENNA_FIELDS_XPATH(html.fromstring(content)):
+                parsed.setdefault(element.get('id'), element.text_content().strip())
+            for element_id in _ANTENNA_FIELD_IDS.values():
+                if not found.get(element_id): found[element_id] = parsed.get(element_id, "N/A")
+
+        return {**device_info, **{field: found[element_id] for field, element_id in _ANTENNA_FIELD_IDS.items()}}
+
+# Clients are kept per gateway so repeated polls in one process reuse their pooled connections.
+_HILINK_CLIENTS: Dict[str, HiLinkClient] = {}
+
+def get_hilink_client(gateway: str) -> HiLinkClient:
+    client = _HILINK_CLIENTS.get(gateway)
+    if client is None: client = _HILINK_CLIENTS[gateway] = HiLinkClient(gateway=gateway)
+    return client
 
 # --- Command Execution & Port Management (for 3proxy) ---
 def run_command(command_list: List[str], timeout: Optional[int] = None, check: bool = True, suppress_error: bool = False) -> str:
@@ -140,92 +381,195 @@ def run_command(command_list: List[str], timeout: Optional[int] = None, check: b
             raise Exception(f"An unexpected error occurred running command: {command_list[0]}. Error: {e}")
         return str(e)
 
-def get_proxy_status(interface_name: str) -> str:
+def get_proxy_statuses(interface_names: List[str]) -> Dict[str, str]:
+    if not interface_names: return {}
+    units = [f"3proxy@{name}.service" for name in interface_names]
     try:
-        # We need pkexec to run systemctl as root.
-        result = run_command(['pkexec', 'systemctl', 'is-active', '--quiet', f"3proxy@{interface_name}.service"], suppress_error=True)
-        return 'running' if 'active' in result else 'stopped'
+        # is-active is read-only, so no pkexec; one state is printed per unit, in order.
+        states = run_command(['systemctl', 'is-active', *units], check=False).splitlines()
+        if len(states) != len(units): raise Exception(f"Expected {len(units)} unit states, got {len(states)}")
+        return {name: 'running' if state == 'active' else 'stopped' for name, state in zip(interface_names, states)}
     except Exception as e:
-        log_message("ERROR", f"Failed to get proxy status for {interface_name}: {e}")
-        return 'error'
+        log_message("ERROR", f"Failed to get proxy statuses for {', '.join(interface_names)}: {e}")
+        return {name: 'error' for name in interface_names}
 
-def get_or_create_proxy_config(interface_name: str, all_configs: Dict) -> Tuple[Dict, bool]:
+def _port_bitmap(ports: Iterable[int], start: int, end: int) -> int:
+    # Bit i is set when port start+i is taken; ports outside [start, end) are ignored.
+    bitmap = 0
+    for port in ports:
+        if isinstance(port, int) and start <= port < end: bitmap |= 1 << (port - start)
+    return bitmap
+
+def _first_free_port(bitmap: int, start: int, end: int) -> Optional[int]:
+    free = ~bitmap & ((1 << (end - start)) - 1)
+    if not free: return None
+    # free & -free isolates the lowest clear bit of the used map, i.e. the lowest free port.
+    return start + (free & -free).bit_length() - 1
+
+def collect_used_ports(all_configs: Dict) -> List[int]:
+    """
+    Returns [http_bitmap, socks_bitmap] of the ports already assigned in all_configs.
+    """
+    return [
+        _port_bitmap((c.get('httpPort') for c in all_configs.values()), CONFIG['HTTP_PORT_RANGE_START'], CONFIG['HTTP_PORT_RANGE_END']),
+        _port_bitmap((c.get('socksPort') for c in all_configs.values()), CONFIG['SOCKS_PORT_RANGE_START'], CONFIG['SOCKS_PORT_RANGE_END']),
+    ]
+
+def get_or_create_proxy_config(interface_name: str, all_configs: Dict, used_ports: Optional[List[int]] = None) -> Tuple[Dict, bool]:
     if interface_name in all_configs: return all_configs[interface_name], False
     
-    used_http_ports = {c.get('httpPort') for c in all_configs.values() if c.get('httpPort')}
-    used_socks_ports = {c.get('socksPort') for c in all_configs.values() if c.get('socksPort')}
+    # Callers allocating for several modems pass used_ports so the config scan happens once per poll.
+    if used_ports is None: used_ports = collect_used_ports(all_configs)
 
-    http_port = next((p for p in range(CONFIG['HTTP_PORT_RANGE_START'], CONFIG['HTTP_PORT_RANGE_END']) if p not in used_http_ports), None)
-    socks_port = next((p for p in range(CONFIG['SOCKS_PORT_RANGE_START'], CONFIG['SOCKS_PORT_RANGE_END']) if p not in used_socks_ports), None)
+    http_port = _first_free_port(used_ports[0], CONFIG['HTTP_PORT_RANGE_START'], CONFIG['HTTP_PORT_RANGE_END'])
+    socks_port = _first_free_port(used_ports[1], CONFIG['SOCKS_PORT_RANGE_START'], CONFIG['SOCKS_PORT_RANGE_END'])
 
     if http_port is None or socks_port is None: raise Exception("No available ports in range.")
+    used_ports[0] |= 1 << (http_port - CONFIG['HTTP_PORT_RANGE_START'])
+    used_ports[1] |= 1 << (socks_port - CONFIG['SOCKS_PORT_RANGE_START'])
     
     new_config = {"httpPort": http_port, "socksPort": socks_port, "username": f"user_{secrets.token_hex(2)}", "password": secrets.token_hex(8), "customName": None}
     log_message("INFO", f"Generated new proxy config for {interface_name} on HTTP:{http_port}/SOCKS:{socks_port}")
     return new_config, True
 
+def allocate_proxy_configs(all_configs: Dict, interface_names: List[str]) -> Dict:
+    # Allocates in place so it can run as a mutate_state_file mutator; stops once a port range is exhausted.
+    used_ports = collect_used_ports(all_configs)
+    for interface_name in interface_names:
+        try: cfg, created = get_or_create_proxy_config(interface_name, all_configs, used_ports)
+        except Exception as e:
+            log_message("ERROR", f"Could not allocate proxy ports for {interface_name}: {e}")
+            break
+        if created: all_configs[interface_name] = cfg
+    return all_configs
+
+_3PROXY_CONFIG_PREAMBLE = "nscache 65536\nnserver 8.8.8.8\nnserver 8.8.4.4\ntimeouts 1 5 30 60 180 1800 15 60\ndaemon\n"
+_3PROXY_AUTH_TEMPLATE = _3PROXY_CONFIG_PREAMBLE + (
+    "users {username}:CL:{password}\nauth strong\nallow {username}\n"
+    "proxy -n -p{http_port} -i0.0.0.0 -e{egress_ip}\nsocks -p{socks_port} -i0.0.0.0 -e{egress_ip}\nflush"
+)
+_3PROXY_OPEN_TEMPLATE = _3PROXY_CONFIG_PREAMBLE + (
+    "auth none\n"
+    "proxy -n -a -p{http_port} -i0.0.0.0 -e{egress_ip}\nsocks -p{socks_port} -i0.0.0.0 -e{egress_ip}\nflush"
+)
+
 def generate_3proxy_config_content(config: Dict, egress_ip: str) -> Optional[str]:
     if not egress_ip or not config.get('httpPort') or not config.get('socksPort'): return None
     
     username, password = config.get('username'), config.get('password')
-    lines = ["nscache 65536", "nserver 8.8.8.8", "nserver 8.8.4.4", "timeouts 1 5 30 60 180 1800 15 60", "daemon"]
-    
-    if username and password:
-        lines.extend([f"users {username}:CL:{password}", "auth strong", f"allow {username}"])
-    else:
-        lines.append("auth none")
-        
-    proxy_flags = "-n" if username and password else "-n -a"
-    lines.append(f"proxy {proxy_flags} -p{config['httpPort']} -i0.0.0.0 -e{egress_ip}")
-    lines.append(f"socks -p{config['socksPort']} -i0.0.0.0 -e{egress_ip}")
-    lines.append("flush")
-    return "\n".join(lines)
+    template = _3PROXY_AUTH_TEMPLATE if username and password else _3PROXY_OPEN_TEMPLATE
+    return template.format(username=username, password=password, http_port=config['httpPort'], socks_port=config['socksPort'], egress_ip=egress_ip)
 
-def write_3proxy_config_file(interface_name: str, egress_ip: str) -> Optional[str]:
+def write_3proxy_config_file(interface_name: str, egress_ip: str, config: Optional[Dict] = None) -> Optional[str]:
     try:
-        all_configs = read_state_file(CONFIG['PROXY_CONFIGS_FILE'])
-        config = all_configs.get(interface_name)
+        if config is None:
+            config = read_state_file(CONFIG['PROXY_CONFIGS_FILE']).get(interface_name)
         if not config: raise Exception(f"No configuration found for {interface_name}")
         
         config_content = generate_3proxy_config_content(config, egress_ip)
         if not config_content: return None
 
         config_file_path = CONFIG['THREPROXY_CONFIG_DIR'] / f"{interface_name}.cfg"
-        config_file_path.write_text(config_content)
-        log_message("DEBUG", f"Wrote 3proxy config for {interface_name}.")
+        content_bytes = config_content.encode('utf-8')
+        # Only rewrite when the file on disk differs.
+        try:
+            if config_file_path.read_bytes() == content_bytes: return str(config_file_path)
+        except FileNotFoundError: pass
+
+        config_file_path.write_bytes(content_bytes)
+        if log_enabled("DEBUG"): log_message("DEBUG", f"Wrote 3proxy config for {interface_name}.")
         return str(config_file_path)
     except Exception as e:
         log_message("ERROR", f"Failed to write 3proxy config for {interface_name}: {e}")
         raise
 
-def get_primary_lan_ip() -> Optional[str]:
-    try:
-        interfaces = run_command(['ip', '-j', 'addr'])
-        interfaces = json.loads(interfaces)
-        modem_pattern = re.compile(r'^(enx|usb|wwan|ppp)')
-        excluded_pattern = re.compile(r'^(lo|docker|veth|br-|cali|vxlan)')
-        
-        for iface in interfaces:
-            ifname = iface.get('ifname', '')
-            if iface.get('operstate') == 'UP' and not excluded_pattern.match(ifname) and not modem_pattern.match(ifname):
-                for addr_info in iface.get('addr_info', []):
-                    if addr_info.get('family') == 'inet':
-                        return addr_info.get('local')
-        return None
-    except Exception: return None
-    
-def discover_hilink_gateways() -> List[Tuple[str, str]]:
+def read_operstate(ifname: str) -> str:
+    try: return Path(f"/sys/class/net/{ifname}/operstate").read_text().strip().upper()
+    except OSError: return 'UNKNOWN'
+
+def read_mac_address(ifname: str) -> Optional[str]:
+    try: return Path(f"/sys/class/net/{ifname}/address").read_text().strip().lower() or None
+    except OSError: return None
+
+def _ttl_cache(ttl: float) -> Callable:
+    """
+    Memoizes a function's result per argument tuple for `ttl` seconds.
+    """
+    def decorator(fn: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            hit = cache.get(args)
+            if hit is not None and now - hit[0] < ttl: return hit[1]
+            value = fn(*args)
+            cache[args] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+# Interface addresses change on the order of seconds; repeated lookups within one burst share a single read.
+@_ttl_cache(2.0)
+def get_ip_addr_info() -> List[Dict]:
+    """
+    Returns the IPv4 view of the host's interfaces in the shape of `ip -j addr`.
+    psutil reads it in-process; without psutil we fall back to running `ip`.
+    """
+    if psutil is None: return json_loads(run_command(['ip', '-j', 'addr']))
+    interfaces = []
+    for ifname, addrs in psutil.net_if_addrs().items():
+        addr_info = [
+            {"family": "inet", "local": addr.address, "prefixlen": ipaddress.IPv4Network(f"0.0.0.0/{addr.netmask}").prefixlen}
+            for addr in addrs if addr.family == socket.AF_INET and addr.netmask
+        ]
+        interfaces.append({"ifname": ifname, "operstate": read_operstate(ifname), "addr_info": addr_info})
+    return interfaces
+
+def _first_inet(addr_info: List[Dict]) -> Optional[str]:
+    for addr in addr_info:
+        if addr.get('family') == 'inet': return addr.get('local')
+    return None
+
+def _classify_interfaces(interfaces: List[Dict]) -> Tuple[Optional[str], Dict[str, str]]:
+    """
+    Splits one `ip -j addr` snapshot in a single pass.
+    Returns (server_lan_ip, {modem_ifname: first_ipv4}) for interfaces that are UP.
+    """
+    server_lan_ip = None
+    modem_ips: Dict[str, str] = {}
+    for iface in interfaces:
+        ifname = iface.get('ifname', '')
+        if iface.get('operstate') != 'UP' or ifname.startswith(_EXCLUDED_IFACE_PREFIXES): continue
+        is_modem = ifname.startswith(_MODEM_IFACE_PREFIXES)
+        if not is_modem and server_lan_ip is not None: continue
+        local = _first_inet(iface.get('addr_info', []))
+        if local is None: continue
+        if is_modem: modem_ips[ifname] = local
+        else: server_lan_ip = local
+    return server_lan_ip, modem_ips
+
+def derive_gateway_ip(server_ip: str, prefixlen: int) -> str:
+    """
+    Returns the first usable address of server_ip's subnet, where HiLink modems put their gateway.
+    Plain integer masking; no ipaddress objects are built.
+    """
+    if not 0 < prefixlen < 32: raise ValueError(f"prefix length /{prefixlen} has no gateway address")
+    ip_int = int.from_bytes(socket.inet_aton(server_ip), 'big')
+    mask = (0xFFFFFFFF << (32 - prefixlen)) & 0xFFFFFFFF
+    return socket.inet_ntoa(((ip_int & mask) | 1).to_bytes(4, 'big'))
+
+def discover_hilink_gateways(interfaces: Optional[List[Dict]] = None) -> List[Tuple[str, str]]:
     """
     Discovers HiLink modem gateways by inspecting network interfaces.
     Returns a list of tuples, where each tuple is (interface_name, gateway_ip).
     """
     gateways = []
     try:
-        ip_info = json.loads(run_command(['ip', '-j', 'addr']))
-        for iface in ip_info:
+        if interfaces is None: interfaces = get_ip_addr_info()
+        for iface in interfaces:
             ifname = iface.get('ifname', '')
             # HiLink modems usually appear as 'enx...' or 'usb...'
-            if iface.get('operstate') == 'UP' and (ifname.startswith('enx') or ifname.startswith('usb')):
+            if iface.get('operstate') == 'UP' and ifname.startswith(_HILINK_IFACE_PREFIXES):
                 for addr_info in iface.get('addr_info', []):
                     if addr_info.get('family') == 'inet':
                         # Example: Server IP is 192.168.8.100, prefix is 24
@@ -234,48 +578,122 @@ def discover_hilink_gateways() -> List[Tuple[str, str]]:
                         prefixlen = addr_info.get('prefixlen')
                         if server_ip and prefixlen:
                             try:
-                                network = ipaddress.IPv4Interface(f"{server_ip}/{prefixlen}").network
-                                # The gateway is typically the first usable IP in the subnet
-                                gateway_ip = str(network[1])
+                                gateway_ip = derive_gateway_ip(server_ip, prefixlen)
                                 gateways.append((ifname, gateway_ip))
-                                log_message("DEBUG", f"Discovered potential HiLink gateway {gateway_ip} on interface {ifname}")
-                            except ValueError as e:
+                                if log_enabled("DEBUG"): log_message("DEBUG", f"Discovered potential HiLink gateway {gateway_ip} on interface {ifname}")
+                            except (OSError, ValueError) as e:
                                 log_message("WARN", f"Could not determine network for {server_ip}/{prefixlen}: {e}")
     except Exception as e:
         log_message("ERROR", f"Failed to discover HiLink gateways: {e}")
     return gateways
 
 # --- Core Logic ---
-def get_all_modem_statuses() -> Dict:
+# Shared pool for per-modem network I/O; worker threads are started on demand and reused across calls.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hilink-io")
+
+# One poll at a time per process. The daemon handles each connection on its own thread, so callers that arrive mid-poll
+# block here and are then served from the cache it just wrote; separate CLI processes do not share the lock.
+_STATUS_POLL_LOCK = threading.Lock()
+_STATUS_CACHE_STATS = {"hits": 0, "misses": 0}
+_STATUS_CACHE_STATS_LOCK = threading.Lock()
+
+def count_status_cache(outcome: str) -> None:
+    # Daemon handlers run on separate threads.
+    with _STATUS_CACHE_STATS_LOCK: _STATUS_CACHE_STATS[outcome] += 1
+
+def read_fresh_status_cache() -> Optional[Dict]:
+    cached = read_state_file(CONFIG['STATUS_CACHE_FILE'])
+    # A negative age means the wall clock stepped back since the entry was written; treat it as stale.
+    if cached and 0 <= time.time() - cached.get('timestamp', 0) < CONFIG['STATUS_CACHE_TTL']: return cached['result']
+    return None
+
+def get_all_modem_statuses(force: bool = False) -> Dict:
+    # CLI calls each run in a fresh process, so the short-lived cache lives on disk to absorb UI polling bursts.
+    if not force:
+        cached = read_fresh_status_cache()
+        if cached is not None:
+            count_status_cache("hits")
+            return cached
+
+    with _STATUS_POLL_LOCK:
+        if not force:
+            cached = read_fresh_status_cache()
+            if cached is not None:
+                count_status_cache("hits")
+                return cached
+        count_status_cache("misses")
+        result = poll_modem_statuses(force)
+        write_state_file(CONFIG['STATUS_CACHE_FILE'], {"timestamp": time.time(), "result": result}, durable=False)
+        return result
+
+def get_status_cache_stats() -> Dict:
+    with _STATUS_CACHE_STATS_LOCK: stats = dict(_STATUS_CACHE_STATS)
+    return {"success": True, "data": {**stats, "ttl": CONFIG['STATUS_CACHE_TTL']}}
+
+def poll_modem_statuses(force: bool = False) -> Dict:
     all_modems_data = []
     proxy_configs = read_state_file(CONFIG['PROXY_CONFIGS_FILE'])
     
-    discovered_gateways = discover_hilink_gateways()
+    # One 'ip -j addr' snapshot serves gateway discovery, modem IPs and the LAN IP for the whole poll; force skips its TTL cache.
+    try:
+        interfaces = get_ip_addr_info.__wrapped__() if force else get_ip_addr_info()
+    except Exception as e:
+        log_message("ERROR", f"Failed to read network interfaces: {e}")
+        interfaces = []
+    discovered_gateways = discover_hilink_gateways(interfaces)
+    server_lan_ip, modem_ips = _classify_interfaces(interfaces)
 
     if not discovered_gateways:
         log_message("INFO", "No HiLink gateways discovered. If you have a modem connected, check its network interface state.")
         return {"success": True, "data": []}
 
-    for ifname, gateway_ip in discovered_gateways:
+    # The interface name for HiLink is based on the gateway to ensure stability
+    interface_names = {gateway_ip: f"hilink_{gateway_ip.replace('.', '_')}" for _, gateway_ip in discovered_gateways}
+    proxy_statuses = get_proxy_statuses(list(interface_names.values()))
+
+    # Device name/IMEI are cached per hardware address, so swapping the modem behind a stable name like usb0 misses the cache.
+    device_keys = [f"{read_mac_address(ifname) or ifname}@{gateway_ip}" for ifname, gateway_ip in discovered_gateways]
+    cached_devices = {} if force else read_state_file(CONFIG['DEVICE_INFO_CACHE_FILE'])
+    devices = {key: cached_devices[key] for key in device_keys if key in cached_devices}
+
+    # Probe the modems concurrently; results are consumed in discovery order.
+    info_futures = [_IO_EXECUTOR.submit(get_hilink_client(gateway_ip).get_info, devices.get(key)) for (_, gateway_ip), key in zip(discovered_gateways, device_keys)]
+
+    probe_results: List[Tuple[Optional[Dict], Optional[Exception]]] = []
+    for info_future in info_futures:
+        try: probe_results.append((info_future.result(), None))
+        except Exception as e: probe_results.append((None, e))
+
+    # Ports are only handed to modems that answered, and are allocated under the configs lock so concurrent polls cannot collide.
+    missing_configs = [interface_names[gateway_ip] for (_, gateway_ip), (hilink_info, _) in zip(discovered_gateways, probe_results)
+                       if hilink_info is not None and interface_names[gateway_ip] not in proxy_configs]
+    allocation_error: Optional[Exception] = None
+    if missing_configs:
+        try:
+            proxy_configs = mutate_state_file(CONFIG['PROXY_CONFIGS_FILE'], lambda configs: allocate_proxy_configs(configs, missing_configs))
+        except Exception as e:
+            # Modems that already have a config are still reported; only the unallocated ones get an error entry.
+            log_message("ERROR", f"Failed to allocate proxy configs: {e}")
+            allocation_error = e
+
+    for (ifname, gateway_ip), device_key, (hilink_info, probe_error) in zip(discovered_gateways, device_keys, probe_results):
         try:
-            hilink_client = HiLinkClient(gateway=gateway_ip)
-            hilink_info = hilink_client.get_info()
+            if probe_error is not None: raise probe_error
+            if device_key not in devices and hilink_info.get("imei", "N/A") != "N/A":
+                devices[device_key] = {"name": hilink_info["name"], "imei": hilink_info["imei"]}
             
-            # The interface name for HiLink is based on the gateway to ensure stability
-            interface_name = f"hilink_{gateway_ip.replace('.', '_')}"
+            interface_name = interface_names[gateway_ip]
             
-            modem_ip = next((addr['local'] for iface in json.loads(run_command(['ip', '-j', 'addr'])) if iface['ifname'] == ifname for addr in iface['addr_info'] if addr['family'] == 'inet'), None)
+            modem_ip = modem_ips.get(ifname)
             
             modem_status = 'connected' if hilink_info.get('connection_status', '').lower() == 'connected' else 'disconnected'
             
-            cfg, created = get_or_create_proxy_config(interface_name, proxy_configs)
-            if created:
-                proxy_configs[interface_name] = cfg
-                write_state_file(CONFIG['PROXY_CONFIGS_FILE'], proxy_configs)
+            cfg = proxy_configs.get(interface_name)
+            if cfg is None: raise allocation_error or Exception("No available ports in range.")
             
-            proxy_status = get_proxy_status(interface_name)
+            proxy_status = proxy_statuses[interface_name]
             if modem_status == 'connected' and modem_ip and proxy_status == 'stopped':
-                 write_3proxy_config_file(interface_name, modem_ip)
+                 write_3proxy_config_file(interface_name, modem_ip, cfg)
 
             modem_data = {
                 "id": hilink_info.get("imei", interface_name),
@@ -287,7 +705,7 @@ def get_all_modem_statuses() -> Dict:
                 "proxyStatus": proxy_status,
                 "source": "hilink_webui",
                 "proxyConfig": cfg,
-                "serverLanIp": get_primary_lan_ip(),
+                "serverLanIp": server_lan_ip,
                 "details": {
                     "operator": hilink_info.get("operator"),
                     "network_mode": hilink_info.get("network_mode"),
@@ -312,38 +730,134 @@ def get_all_modem_statuses() -> Dict:
                 "proxyStatus": "error",
                 "source": "hilink_webui",
                 "proxyConfig": None,
-                "serverLanIp": get_primary_lan_ip(),
+                "serverLanIp": server_lan_ip,
                 "details": {"error": str(e)}
             })
 
+    # Steady-state polls touch no state files.
+    if devices != cached_devices:
+        write_state_file(CONFIG['DEVICE_INFO_CACHE_FILE'], devices, durable=False)
+
     return {"success": True, "data": all_modems_data}
 
 # --- Action Dispatcher ---
+def write_result(result: Dict) -> None:
+    # The Node side joins stdout lines before parsing.
+    sys.stdout.buffer.write(json_dumpb(result, pretty=CONFIG['PRETTY_JSON']) + b'\n')
+    sys.stdout.buffer.flush()
+
+# action -> (handler, argv-to-kwargs)
+ACTIONS: Dict[str, Tuple[Callable[..., Dict], Callable[[List[str]], Dict[str, Any]]]] = {
+    'get_all_modem_statuses': (get_all_modem_statuses, lambda args: {"force": '--force' in args}),
+    'get_logs': (get_logs, lambda args: {"cursor": args[0] if args else None}),
+    'get_status_cache_stats': (get_status_cache_stats, lambda args: {}),
+}
+
+def dispatch(action: str, args: List[str]) -> Dict:
+    try:
+        if log_enabled("DEBUG"): log_message("DEBUG", f"Backend action '{action}' called with args: {args}")
+        
+        handler = ACTIONS.get(action)
+        if handler is None:
+            return {"success": False, "error": f"Action '{action}' is not yet implemented for HiLink modems."}
+        func, build_kwargs = handler
+        return func(**build_kwargs(args))
+            
+    except Exception as e:
+        log_message("ERROR", f"Unhandled error executing action '{action}': {e}")
+        return {"success": False, "error": str(e), "type": type(e).__name__}
+
+# --- Daemon Mode ---
+# `backend_controller.py daemon` keeps sessions, caches and the worker pool warm; CLI calls forward to it when it is up.
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    # One thread per connection, so a slow modem poll does not hold up get_logs and other quick actions.
+    daemon_threads = True
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json_loads(self.rfile.readline())
+            result = dispatch(str(request.get('action', '')), [str(arg) for arg in request.get('args', [])])
+        except Exception as e:
+            # Any malformed request (e.g. non-iterable args) still gets a response line.
+            result = {"success": False, "error": f"Malformed daemon request: {e}"}
+        self.wfile.write(json_dumpb(result) + b'\n')
+
+def clear_stale_daemon_socket(socket_path: Path) -> None:
+    """
+    Removes a socket file left behind by a daemon that died; raises if a live daemon still answers on it.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try: sock.connect(str(socket_path))
+        except FileNotFoundError: return
+        except ConnectionRefusedError:
+            socket_path.unlink(missing_ok=True)
+            return
+    raise Exception(f"Backend daemon is already listening on {socket_path}.")
+
+def run_daemon() -> None:
+    socket_path = CONFIG['DAEMON_SOCKET']
+    clear_stale_daemon_socket(socket_path)
+    # SIGTERM unwinds through serve_forever so the socket file is removed on shutdown.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with DaemonServer(str(socket_path), DaemonRequestHandler) as server:
+        os.chmod(socket_path, 0o600)
+        bound_inode = socket_path.stat().st_ino
+        log_message("INFO", f"Backend daemon listening on {socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            # Leave the path alone if another daemon has since bound it.
+            try:
+                if socket_path.stat().st_ino == bound_inode: socket_path.unlink()
+            except FileNotFoundError: pass
+
+def forward_to_daemon(action: str, args: List[str]) -> Optional[bytes]:
+    """
+    Sends the action to a running daemon and returns its raw JSON response line.
+    Returns None when no daemon is listening, so the caller runs the action in-process.
+    """
+    socket_path = CONFIG['DAEMON_SOCKET']
+    if not socket_path.exists(): return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONFIG['DAEMON_TIMEOUT'])
+        try: sock.connect(str(socket_path))
+        except OSError: return None
+        sock.sendall(json_dumpb({"action": action, "args": args}) + b'\n')
+        with sock.makefile('rb') as response:
+            line = response.readline()
+    if not line.endswith(b'\n'): raise Exception("Backend daemon closed the connection without a complete response.")
+    return line
+
 def main():
     initialize_environment()
     if len(sys.argv) < 2:
-        print(json.dumps({"success": False, "error": "No action specified"}))
+        write_result({"success": False, "error": "No action specified"})
         sys.exit(1)
 
     action = sys.argv[1]
     args = sys.argv[2:]
-    result = {}
-    
+
+    if action == 'daemon':
+        try: run_daemon()
+        except Exception as e:
+            log_message("ERROR", f"Backend daemon failed to start: {e}")
+            write_result({"success": False, "error": str(e)})
+            flush_log()
+            sys.exit(1)
+        return
+
     try:
-        log_message("DEBUG", f"Backend action '{action}' called with args: {args}")
-        
-        if action == 'get_all_modem_statuses':
-            result = get_all_modem_statuses()
-        else:
-            result = {"success": False, "error": f"Action '{action}' is not yet implemented for HiLink modems."}
-            
+        forwarded = forward_to_daemon(action, args)
     except Exception as e:
-        log_message("ERROR", f"Unhandled error executing action '{action}': {e}")
-        result = {"success": False, "error": str(e), "type": type(e).__name__}
-    
-    print(json.dumps(result, indent=None))
+        log_message("ERROR", f"Backend daemon failed to handle action '{action}': {e}")
+        forwarded = json_dumpb({"success": False, "error": str(e), "type": type(e).__name__}) + b'\n'
+    if forwarded is not None:
+        sys.stdout.buffer.write(forwarded)
+        sys.stdout.buffer.flush()
+    else:
+        write_result(dispatch(action, args))
+    flush_log()
 
 if __name__ == "__main__":
     main()
-
-    
\ No newline at end of file